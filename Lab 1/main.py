@@ -1,7 +1,10 @@
 import doctest
+import heapq
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import count
 from unittest.mock import patch
-from typing import Optional, Set
+from typing import Deque, Dict, Hashable, List, Optional, Set, Tuple
 
 
 class User:
@@ -236,8 +239,214 @@ class Contacts:
             print(f"Невозможно установить связь между {caller.username} и {receiver.username}.")
 
 
+class Leaderboard:
+    def __init__(self) -> None:
+        """
+        Конструктор класса Leaderboard — счётчиков с быстрым получением k лидеров.
+
+        Значения хранятся в словаре, а для выборки лидеров используется куча с ленивым удалением:
+        при каждом изменении счётчика в кучу добавляется новая запись, а устаревшие записи
+        отбрасываются при чтении. Поэтому изменение стоит O(log n), а выборка k лидеров — O(k log n)
+        (с учётом амортизированного удаления устаревших записей).
+
+        Attributes:
+            counts (Dict[Hashable, int]): Текущие значения счётчиков (нулевые удаляются).
+
+        Methods:
+            add(key, delta=1):
+                Изменяет счётчик и возвращает его новое значение.
+            get(key):
+                Возвращает значение счётчика.
+            top(k):
+                Возвращает k ключей с наибольшими значениями.
+
+        Example:
+            >>> board = Leaderboard()
+            >>> board.add("a")
+            1
+            >>> board.get("b")
+            0
+
+        """
+        self.counts: Dict[Hashable, int] = {}
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._order = count()
+        self._last_order: Dict[Hashable, int] = {}  # Номер последнего изменения каждого ключа для разбора ничьих
+
+    def add(self, key: Hashable, delta: int = 1) -> int:
+        """
+        Изменяет счётчик на delta и возвращает его новое значение.
+
+        Args:
+            key (Hashable): Ключ счётчика.
+            delta (int, optional): Изменение. По умолчанию 1.
+
+        Returns:
+            int: Новое значение счётчика.
+
+        Example:
+            >>> board = Leaderboard()
+            >>> board.add("a", 3)
+            3
+            >>> board.add("a", -3)
+            0
+            >>> board.counts
+            {}
+
+        """
+        value = self.counts.get(key, 0) + delta
+        if value:
+            self.counts[key] = value
+            self._last_order[key] = order = next(self._order)
+            heapq.heappush(self._heap, (-value, order, key))
+        else:
+            self.counts.pop(key, None)
+            self._last_order.pop(key, None)
+        if len(self._heap) > 2 * len(self.counts) + 64:
+            # Слишком много устаревших записей — перестраиваем кучу по текущим значениям,
+            # сохраняя номера изменений, чтобы не нарушить порядок при равных значениях
+            self._heap = [(-value, self._last_order[key], key) for key, value in self.counts.items()]
+            heapq.heapify(self._heap)
+        return value
+
+    def get(self, key: Hashable) -> int:
+        """
+        Возвращает значение счётчика.
+
+        Args:
+            key (Hashable): Ключ счётчика.
+
+        Returns:
+            int: Значение счётчика или 0, если ключ не встречался.
+
+        Example:
+            >>> board = Leaderboard()
+            >>> board.add("a", 2)
+            2
+            >>> board.get("a")
+            2
+
+        """
+        return self.counts.get(key, 0)
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """
+        Возвращает k ключей с наибольшими значениями.
+
+        При равных значениях выше оказывается ключ, который достиг значения раньше.
+
+        Args:
+            k (int): Количество лидеров.
+
+        Returns:
+            List[Tuple[Hashable, int]]: Пары (ключ, значение) по убыванию значения.
+
+        Example:
+            >>> board = Leaderboard()
+            >>> for key in "abacab":
+            ...     _ = board.add(key)
+            >>> board.top(2)
+            [('a', 3), ('b', 2)]
+
+            Ключ, который вернулся к прежнему значению, достиг его позже:
+
+            >>> board = Leaderboard()
+            >>> for key, delta in [("a", 1), ("b", 1), ("a", 1), ("a", -1)]:
+            ...     _ = board.add(key, delta)
+            >>> board.top(2)
+            [('b', 1), ('a', 1)]
+
+        """
+        result: List[Tuple[Hashable, int]] = []
+        valid: List[Tuple[int, int, Hashable]] = []
+        while self._heap and len(result) < k:
+            entry = heapq.heappop(self._heap)
+            value, order, key = entry
+            # Запись актуальна, только если это последнее изменение ключа: старая запись с тем же
+            # значением (ключ уменьшился до прежнего значения) хранит более ранний номер
+            if self._last_order.get(key) == order:
+                result.append((key, -value))
+                valid.append(entry)
+        for entry in valid:
+            heapq.heappush(self._heap, entry)
+        return result
+
+
+# Политика прав в группе: действие -> роль того, кто действует -> роли, над которыми действие разрешено.
+# Роль "creator" — создатель группы, пока он в ней состоит; None — пользователь не состоит в группе
+# (для действий без цели, например send_message, целью считается None);
+# "*" — любая роль участника, которая в политике не названа (add_member принимает произвольную роль).
+# Роли "creator" и "*" определяются только группой: участник, которому они записаны в members, считается "*".
+GROUP_PERMISSIONS: Dict[str, Dict[str, Set[Optional[str]]]] = {
+    "promote_to_admin": {
+        "creator": {"member"},
+        "admin": {"member"},
+    },
+    "demote_to_member": {
+        "creator": {"admin"},
+    },
+    "remove_member": {
+        "creator": {"creator", "admin", "member", "banned", "*"},
+        "admin": {"member", "banned", "*"},
+    },
+    "ban_member": {
+        "creator": {"admin", "member", "*"},
+        "admin": {"member", "*"},
+    },
+    "send_message": {
+        "creator": {None},
+        "admin": {None},
+        "member": {None},
+        "*": {None},
+    },
+}
+
+
+def compile_permissions(
+        permissions: Dict[str, Dict[str, Set[Optional[str]]]],
+) -> Dict[Tuple[Optional[str], Optional[str], str], bool]:
+    """
+    Компилирует политику прав в таблицу, которую можно проверять за O(1).
+
+    Args:
+        permissions (Dict[str, Dict[str, Set[Optional[str]]]]): Политика в формате GROUP_PERMISSIONS.
+
+    Returns:
+        Dict[Tuple[Optional[str], Optional[str], str], bool]: Таблица
+            (роль действующего, роль цели, действие) -> разрешено ли действие.
+            Для всех сочетаний ролей, упомянутых в политике, хранится явное значение;
+            роли, не упомянутые в политике, перед проверкой заменяются на "*".
+
+    Example:
+        >>> table = compile_permissions({"kick": {"admin": {"member"}}})
+        >>> table[("admin", "member", "kick")], table[("member", "admin", "kick")]
+        (True, False)
+
+    """
+    roles: Set[Optional[str]] = {None}
+    for rules in permissions.values():
+        roles.update(rules)
+        for targets in rules.values():
+            roles.update(targets)
+    return {
+        (actor_role, target_role, action): target_role in rules.get(actor_role, ())
+        for action, rules in permissions.items()
+        for actor_role in roles
+        for target_role in roles
+    }
+
+
 class Group:
-    def __init__(self, name: str, creator: User, min_age_to_join: Optional[int] = 0) -> None:
+    permissions: Dict[Tuple[Optional[str], Optional[str], str], bool] = compile_permissions(GROUP_PERMISSIONS)
+    permission_roles: Set[Optional[str]] = {actor_role for actor_role, _, _ in permissions}
+
+    def __init__(
+            self,
+            name: str,
+            creator: User,
+            min_age_to_join: Optional[int] = 0,
+            activity_window: timedelta = timedelta(hours=1),
+    ) -> None:
         """
         Выводит информацию о пользователе в группе по его имени.
 
@@ -245,14 +454,26 @@ class Group:
             name (str): Название группы.
             creator (User): Создатель группы.
             min_age_to_join (int, optional): Минимальный возраст для вступления в группу. По умолчанию 0.
+            activity_window (timedelta, optional): Окно для статистики недавней активности. По умолчанию 1 час.
 
         Attributes:
             name (str): Название группы.
             creator (User): Создатель группы.
             min_age_to_join (int): Минимальный возраст для вступления в группу.
             members (dict): Словарь для хранения ролей участников группы.
+                Роли следует менять методами группы, иначе устареет role_counts.
             messages (list): Список сообщений в группе.
             contacts (Contacts): Объект класса Contacts для хранения контактов группы.
+            activity_window (timedelta): Окно для статистики недавней активности.
+            role_counts (Dict[str, int]): Количество участников с каждой ролью.
+            message_counts (Leaderboard): Количество сообщений каждого отправителя за всё время.
+            recent_message_counts (Leaderboard): Количество сообщений каждого отправителя в окне activity_window.
+            recent_messages (Deque[Tuple[datetime, User]]): Время и отправитель сообщений в окне activity_window.
+            permissions (Dict[Tuple[Optional[str], Optional[str], str], bool]): Скомпилированная политика прав
+                (по умолчанию GROUP_PERMISSIONS), общая для всех групп.
+
+        Статистика обновляется методами add_member, promote_to_admin, demote_to_member,
+        remove_member, ban_member и send_message, поэтому запросы к ней не зависят от длины истории.
 
         Methods:
             add_member(user, role="member"):
@@ -263,12 +484,28 @@ class Group:
                 Понижает пользователя до обычного участника группы.
             remove_member(remover, user):
                 Удаляет пользователя из группы.
+            ban_member(moderator, user):
+                Блокирует пользователя в группе.
             send_message(sender, text):
                 Отправляет сообщение в группу от указанного пользователя.
             show_info():
                 Выводит информацию о группе, ее создателе, участниках и сообщениях.
             get_user_info(username):
                 Выводит информацию о пользователе в группе по его имени.
+            can(actor, action, target=None):
+                Проверяет по политике прав, может ли пользователь выполнить действие.
+            get_role_count(role):
+                Возвращает количество участников с указанной ролью.
+            get_message_count(user):
+                Возвращает количество сообщений пользователя.
+            get_messages_per_member():
+                Возвращает среднее количество сообщений на участника.
+            get_top_senders(k):
+                Возвращает k самых активных отправителей за всё время.
+            get_recent_top_senders(k):
+                Возвращает k самых активных отправителей в окне activity_window.
+            get_recent_message_rate():
+                Возвращает количество сообщений в минуту в окне activity_window.
 
         Prints:
             Информация о пользователе в группе.
@@ -294,6 +531,107 @@ class Group:
         self.members: dict = {creator: "admin"}  # Используем словарь для хранения ролей участников
         self.messages: list = []
         self.contacts: Contacts = Contacts()
+        self.activity_window: timedelta = activity_window
+        self.role_counts: Dict[str, int] = {"admin": 1}
+        self.message_counts: Leaderboard = Leaderboard()
+        self.recent_message_counts: Leaderboard = Leaderboard()
+        self.recent_messages: Deque[Tuple[datetime, User]] = deque()
+        self._role_cache: Dict[User, Tuple[str, str]] = {}
+
+    def _change_role(self, user: User, role: Optional[str]) -> None:
+        """
+        Изменяет роль участника и счётчики ролей. Роль None означает удаление из группы.
+        """
+        self._role_cache.pop(user, None)
+        old_role = self.members.pop(user, None) if role is None else self.members.get(user)
+        if old_role is not None:
+            self.role_counts[old_role] -= 1
+        if role is not None:
+            self.members[user] = role
+            self.role_counts[role] = self.role_counts.get(role, 0) + 1
+
+    def _role(self, user: User) -> Optional[str]:
+        """
+        Возвращает роль пользователя для проверки прав: "creator" для создателя, состоящего в группе,
+        роль участника для остальных ("*", если политика эту роль не называет или она зарезервирована)
+        и None, если пользователь не состоит в группе.
+        Роли участников запоминаются вместе с ролью из members: если роль в members изменилась
+        в обход методов группы, запись кэша не используется. Не участники не кэшируются.
+        """
+        role = self.members.get(user)
+        if role is None:
+            return None
+        cached = self._role_cache.get(user)
+        if cached is not None and cached[0] == role:
+            return cached[1]
+        if user == self.creator:
+            resolved = "creator"
+        elif role in ("creator", "*") or role not in self.permission_roles:
+            resolved = "*"
+        else:
+            resolved = role
+        self._role_cache[user] = (role, resolved)
+        return resolved
+
+    def can(self, actor: User, action: str, target: Optional[User] = None) -> bool:
+        """
+        Проверяет по политике прав, может ли пользователь выполнить действие.
+
+        Args:
+            actor (User): Пользователь, выполняющий действие.
+            action (str): Действие: "promote_to_admin", "demote_to_member", "remove_member" или "send_message".
+            target (User, optional): Пользователь, над которым выполняется действие. По умолчанию None.
+
+        Returns:
+            bool: True, если действие разрешено.
+
+        Example:
+            >>> group = Group("Team", User("Admin", datetime(1990, 1, 1), "City A"), min_age_to_join=18)
+            >>> user1 = User("User1", datetime(1995, 5, 15), "City B")
+            >>> group.add_member(user1)
+            Пользователь User1 добавлен в группу Team как member.
+            Контакт User1 добавлен.
+            >>> group.can(group.creator, "promote_to_admin", user1), group.can(user1, "remove_member", group.creator)
+            (True, False)
+
+            Роли, не названные в политике, могут писать сообщения, а создатель может удалить их обладателя:
+
+            >>> guest = User("Guest", datetime(1995, 5, 15), "City C")
+            >>> group.add_member(guest, role="guest")
+            Пользователь Guest добавлен в группу Team как guest.
+            Контакт Guest добавлен.
+            >>> group.send_message(guest, "Привет!")
+            Guest отправил сообщение в группе Team: Привет!
+            >>> group.remove_member(group.creator, guest)
+            Пользователь Guest удален из группы Team (удалено создателем Admin).
+
+            Права создателя определяются только самим создателем, а не записанной ролью:
+
+            >>> eve = User("Eve", datetime(1995, 5, 15), "City D")
+            >>> group.add_member(eve, role="creator")
+            Пользователь Eve добавлен в группу Team как creator.
+            Контакт Eve добавлен.
+            >>> group.remove_member(eve, group.creator)
+            Eve не имеет права удалить пользователя Admin.
+
+            Роль, изменённая напрямую в members, сразу учитывается при проверке прав:
+
+            >>> group.members[user1] = "banned"
+            >>> group.send_message(user1, "Привет!")
+            User1 не может отправить сообщение в группе Team.
+
+        """
+        target_role = None if target is None else self._role(target)
+        return self.permissions.get((self._role(actor), target_role, action), False)
+
+    def _expire_recent(self, now: datetime) -> None:
+        """
+        Удаляет из окна активности сообщения старше activity_window.
+        """
+        border = now - self.activity_window
+        while self.recent_messages and self.recent_messages[0][0] <= border:
+            _, sender = self.recent_messages.popleft()
+            self.recent_message_counts.add(sender, -1)
 
     def add_member(self, user: User, role: str = "member") -> None:
         """
@@ -322,7 +660,7 @@ class Group:
             print(
                 f"Пользователь {user.username} не может вступить в группу {self.name}, так как его возраст меньше {self.min_age_to_join} лет.")
         elif user not in self.members:
-            self.members[user]: str = role
+            self._change_role(user, role)
             print(f"Пользователь {user.username} добавлен в группу {self.name} как {role}.")
             self.contacts.add_contact(user)
         else:
@@ -352,9 +690,8 @@ class Group:
             Пользователь User1 был повышен до админа в группе Team.
 
         """
-        if user in self.members and self.members[user] == "member" and (
-                promoter == self.creator or self.members.get(promoter) == "admin"):
-            self.members[user]: str = "admin"
+        if self.can(promoter, "promote_to_admin", user):
+            self._change_role(user, "admin")
             print(f"Пользователь {user.username} был повышен до админа в группе {self.name}.")
         else:
             print(f"{promoter.username} не имеет права повысить пользователя {user.username} до админа.")
@@ -394,8 +731,8 @@ class Group:
             - User1 (member)
             Сообщения:
         """
-        if user in self.members and self.members[user] == "admin" and creator == self.creator:
-            self.members[user] = "member"
+        if self.can(creator, "demote_to_member", user):
+            self._change_role(user, "member")
             print(f"Пользователь {user.username} был понижен до обычного пользователя в группе {self.name}.")
         else:
             print(f"{creator.username} не имеет права понизить пользователя {user.username} до обычного пользователя.")
@@ -416,21 +753,52 @@ class Group:
 
         """
         if user in self.members:
-            if remover == self.creator:
-                # Создатель группы имеет право удалить любого пользователя
-                del self.members[user]
-                print(
-                    f"Пользователь {user.username} удален из группы {self.name} (удалено создателем {remover.username}).")
-            elif self.members[remover] == "admin" and self.members[user] != "admin":
-                # Админ может удалить обычного пользователя
-                del self.members[user]
+            if self.can(remover, "remove_member", user):
+                # Создатель группы может удалить любого пользователя, админ — только обычного
+                remover_title = "создателем" if self._role(remover) == "creator" else "админом"
+                self._change_role(user, None)
                 print(
-                    f"Пользователь {user.username} удален из группы {self.name} (удалено админом {remover.username}).")
+                    f"Пользователь {user.username} удален из группы {self.name} "
+                    f"(удалено {remover_title} {remover.username}).")
             else:
                 print(f"{remover.username} не имеет права удалить пользователя {user.username}.")
         else:
             print(f"Пользователь {user.username} не найден в группе {self.name}.")
 
+    def ban_member(self, moderator: User, user: User) -> None:
+        """
+        Блокирует пользователя в группе: он остаётся участником, но не может отправлять сообщения.
+
+        Args:
+            moderator (User): Пользователь, блокирующий другого пользователя.
+            user (User): Пользователь, которого нужно заблокировать.
+
+        Returns:
+            None
+
+        Prints:
+            Сообщение о блокировке пользователя.
+
+        Example:
+            >>> group = Group("Team", User("Admin", datetime(1990, 1, 1), "City A"), min_age_to_join=18)
+            >>> user1 = User("User1", datetime(1995, 5, 15), "City B")
+            >>> group.add_member(user1)
+            Пользователь User1 добавлен в группу Team как member.
+            Контакт User1 добавлен.
+            >>> group.ban_member(group.creator, user1)
+            Пользователь User1 заблокирован в группе Team.
+            >>> group.send_message(user1, "Привет!")
+            User1 не может отправить сообщение в группе Team.
+            >>> group.get_role_count("member"), group.get_role_count("banned")
+            (0, 1)
+
+        """
+        if self.can(moderator, "ban_member", user):
+            self._change_role(user, "banned")
+            print(f"Пользователь {user.username} заблокирован в группе {self.name}.")
+        else:
+            print(f"{moderator.username} не имеет права заблокировать пользователя {user.username}.")
+
     def send_message(self, sender: User, text: str) -> None:
         """
         Отправляет сообщение в группу от указанного пользователя.
@@ -462,10 +830,15 @@ class Group:
             - Admin (admin)
             Сообщения:
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if sender in self.members and self.members[sender] != "banned":
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        if self.can(sender, "send_message"):
             message = f"{sender.username} ({timestamp}): {text}"
             self.messages.append(message)
+            self.message_counts.add(sender)
+            self._expire_recent(now)
+            self.recent_messages.append((now, sender))
+            self.recent_message_counts.add(sender)
             print(f"{sender.username} отправил сообщение в группе {self.name}: {text}")
         else:
             print(f"{sender.username} не может отправить сообщение в группе {self.name}.")
@@ -569,6 +942,147 @@ class Group:
                 return
         print(f"Пользователь {username} не найден в группе {self.name}.")
 
+    def get_role_count(self, role: str) -> int:
+        """
+        Возвращает количество участников группы с указанной ролью.
+
+        Args:
+            role (str): Роль, например "admin" или "member".
+
+        Returns:
+            int: Количество участников с этой ролью.
+
+        Example:
+            >>> group = Group("Team", User("Admin", datetime(1990, 1, 1), "City A"), min_age_to_join=18)
+            >>> user1 = User("User1", datetime(1995, 5, 15), "City B")
+            >>> group.add_member(user1)
+            Пользователь User1 добавлен в группу Team как member.
+            Контакт User1 добавлен.
+            >>> group.get_role_count("admin"), group.get_role_count("member")
+            (1, 1)
+
+        """
+        return self.role_counts.get(role, 0)
+
+    def get_message_count(self, user: User) -> int:
+        """
+        Возвращает количество сообщений, отправленных пользователем в группу.
+
+        Args:
+            user (User): Отправитель.
+
+        Returns:
+            int: Количество сообщений пользователя.
+
+        Example:
+            >>> admin = User("Admin", datetime(1990, 1, 1), "City A")
+            >>> group = Group("Team", admin)
+            >>> group.send_message(admin, "Привет!")
+            Admin отправил сообщение в группе Team: Привет!
+            >>> group.get_message_count(admin)
+            1
+
+        """
+        return self.message_counts.get(user)
+
+    def get_messages_per_member(self) -> float:
+        """
+        Возвращает среднее количество сообщений на одного участника группы.
+
+        Returns:
+            float: Количество сообщений, делённое на количество участников.
+
+        Example:
+            >>> admin = User("Admin", datetime(1990, 1, 1), "City A")
+            >>> group = Group("Team", admin)
+            >>> group.add_member(User("User1", datetime(1995, 5, 15), "City B"))
+            Пользователь User1 добавлен в группу Team как member.
+            Контакт User1 добавлен.
+            >>> group.send_message(admin, "Привет!")
+            Admin отправил сообщение в группе Team: Привет!
+            >>> group.get_messages_per_member()
+            0.5
+
+        """
+        return len(self.messages) / len(self.members) if self.members else 0.0
+
+    def get_top_senders(self, k: int) -> List[Tuple[User, int]]:
+        """
+        Возвращает k самых активных отправителей за всё время.
+
+        Args:
+            k (int): Количество отправителей.
+
+        Returns:
+            List[Tuple[User, int]]: Пары (пользователь, количество сообщений) по убыванию активности.
+
+        Example:
+            >>> admin = User("Admin", datetime(1990, 1, 1), "City A")
+            >>> user1 = User("User1", datetime(1995, 5, 15), "City B")
+            >>> group = Group("Team", admin)
+            >>> group.add_member(user1)
+            Пользователь User1 добавлен в группу Team как member.
+            Контакт User1 добавлен.
+            >>> for sender in (admin, user1, user1):
+            ...     group.send_message(sender, "Привет!")
+            Admin отправил сообщение в группе Team: Привет!
+            User1 отправил сообщение в группе Team: Привет!
+            User1 отправил сообщение в группе Team: Привет!
+            >>> [(user.username, messages) for user, messages in group.get_top_senders(2)]
+            [('User1', 2), ('Admin', 1)]
+
+        """
+        return self.message_counts.top(k)
+
+    def get_recent_top_senders(self, k: int) -> List[Tuple[User, int]]:
+        """
+        Возвращает k самых активных отправителей за последние activity_window.
+
+        Args:
+            k (int): Количество отправителей.
+
+        Returns:
+            List[Tuple[User, int]]: Пары (пользователь, количество сообщений в окне) по убыванию активности.
+
+        Example:
+            >>> admin = User("Admin", datetime(1990, 1, 1), "City A")
+            >>> group = Group("Team", admin)
+            >>> with patch('main.datetime') as mock_datetime:
+            ...     mock_datetime.now.side_effect = [
+            ...         datetime(2023, 12, 3, 0, 0, 0),
+            ...         datetime(2023, 12, 3, 2, 0, 0),
+            ...         datetime(2023, 12, 3, 2, 30, 0),
+            ...     ]
+            ...     group.send_message(admin, "Старое сообщение")
+            ...     group.send_message(admin, "Новое сообщение")
+            ...     [(user.username, messages) for user, messages in group.get_recent_top_senders(1)]
+            Admin отправил сообщение в группе Team: Старое сообщение
+            Admin отправил сообщение в группе Team: Новое сообщение
+            [('Admin', 1)]
+
+        """
+        self._expire_recent(datetime.now())
+        return self.recent_message_counts.top(k)
+
+    def get_recent_message_rate(self) -> float:
+        """
+        Возвращает среднее количество сообщений в минуту за последние activity_window.
+
+        Returns:
+            float: Количество сообщений в минуту.
+
+        Example:
+            >>> admin = User("Admin", datetime(1990, 1, 1), "City A")
+            >>> group = Group("Team", admin, activity_window=timedelta(minutes=2))
+            >>> group.send_message(admin, "Привет!")
+            Admin отправил сообщение в группе Team: Привет!
+            >>> group.get_recent_message_rate()
+            0.5
+
+        """
+        self._expire_recent(datetime.now())
+        return len(self.recent_messages) / (self.activity_window / timedelta(minutes=1))
+
 
 if __name__ == "__main__":
     # with open('tests.txt', 'r', encoding='utf-8') as file:
@@ -0,0 +1,287 @@
+import heapq
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from createClassLibrary import BOOKS_DATABASE, Book, Library
+
+
+class Loan(NamedTuple):
+    """
+    Выдача экземпляра книги читателю.
+
+    Attributes:
+    - loan_id (int): Уникальный идентификатор выдачи.
+    - book_id (int): Идентификатор книги.
+    - reader (str): Имя читателя.
+    - due (datetime): Срок возврата.
+    """
+
+    loan_id: int
+    book_id: int
+    reader: str
+    due: datetime
+
+
+class Lending:
+    """
+    Класс, представляющий выдачу книг библиотеки читателям.
+
+    Для каждой книги хранится количество экземпляров и количество свободных экземпляров.
+    Книги с хотя бы одним свободным экземпляром отмечены в битовой карте доступности,
+    поэтому проверка доступности выполняется за O(1), а перебор доступных книг
+    пропускает целые 64-битные слова занятых книг.
+    Сроки возврата хранятся в куче, поэтому поиск просроченных выдач не перебирает все выдачи.
+    Очередь резервов каждой книги — тоже куча: постановка и отмена резерва выполняются за O(log N).
+    Каталог запоминается при создании объекта: книги, добавленные в library.books позже,
+    не выдаются, а изменение порядка списка не влияет на выдачи.
+    Если в каталоге есть книги с одинаковым id или количество экземпляров отрицательное,
+    вызывается ошибка ValueError.
+
+    Attributes:
+    - library (Library): Библиотека, книги которой выдаются.
+    - books (Tuple[Book, ...]): Каталог книг на момент создания объекта.
+    - loan_period (timedelta): Срок выдачи.
+    - loans (Dict[int, Loan]): Текущие выдачи по их идентификаторам.
+
+    Methods:
+    - add_copies: Добавляет экземпляры книги.
+    - get_copies: Возвращает общее количество экземпляров книги.
+    - get_available_copies: Возвращает количество свободных экземпляров книги.
+    - is_available: Проверяет, есть ли свободный экземпляр книги.
+    - count_available: Возвращает количество книг, которые можно взять.
+    - iter_available: Перебирает книги, которые можно взять.
+    - checkout: Выдаёт экземпляр книги читателю.
+    - return_book: Принимает экземпляр книги обратно.
+    - place_hold: Ставит читателя в очередь на книгу.
+    - cancel_hold: Отменяет резерв.
+    - get_hold_count: Возвращает количество резервов на книгу.
+    - get_overdue: Возвращает просроченные выдачи.
+
+    Usage:
+    *** library = Library(books=[Book(id_=1, name="test_name_1", pages=200)])
+    *** lending = Lending(library)
+    *** loan = lending.checkout(1, "reader_1", now=datetime(2023, 12, 1))
+    *** print(lending.is_available(1))
+    False
+    *** hold_id = lending.place_hold(1, "reader_2")
+    *** print(lending.return_book(loan.loan_id, now=datetime(2023, 12, 5)))
+    Loan(loan_id=3, book_id=1, reader='reader_2', due=datetime.datetime(2023, 12, 19, 0, 0))
+    *** print(lending.get_overdue(now=datetime(2024, 1, 1)))
+    [Loan(loan_id=3, book_id=1, reader='reader_2', due=datetime.datetime(2023, 12, 19, 0, 0))]
+    """
+
+    def __init__(self, library: Library, copies: int = 1, loan_period: timedelta = timedelta(days=14)):
+        if copies < 0:
+            raise ValueError("Количество экземпляров не может быть отрицательным")
+        self.library = library
+        self.books: Tuple[Book, ...] = tuple(library.books)
+        self.loan_period = loan_period
+        self.loans: Dict[int, Loan] = {}
+        self._book_ids: List[int] = [book.id_ for book in self.books]
+        self._positions: Dict[int, int] = {book_id: i for i, book_id in enumerate(self._book_ids)}
+        if len(self._positions) != len(self._book_ids):
+            raise ValueError("В библиотеке есть книги с одинаковым id")
+        self._copies: List[int] = [copies] * len(self.books)
+        self._available: List[int] = [copies] * len(self.books)
+        # Битовая карта: бит i установлен, если у книги books[i] есть свободный экземпляр
+        self._bitmap = bytearray(b"\xff" if copies > 0 else b"\x00") * ((len(self.books) + 63) // 64 * 8)
+        self._available_count = len(self.books) if copies > 0 else 0
+        for i in range(len(self.books), len(self._bitmap) * 8):
+            self._bitmap[i >> 3] &= ~(1 << (i & 7))
+        self._due: List[Tuple[datetime, int]] = []
+        self._overdue: Set[int] = set()
+        self._holds: Dict[int, List[int]] = {}
+        self._hold_counts: Dict[int, int] = {}
+        self._hold_readers: Dict[int, Tuple[int, str]] = {}
+        self._ids = count(1)
+
+    def _position(self, book_id: int) -> int:
+        """
+        Возвращает индекс книги в books.
+        Если книги с запрашиваемым id не существует, вызывается ошибка ValueError.
+        """
+        try:
+            return self._positions[book_id]
+        except KeyError:
+            raise ValueError("Книги с запрашиваемым id не существует") from None
+
+    def _set_available(self, position: int, available: int) -> None:
+        """
+        Обновляет количество свободных экземпляров и битовую карту доступности.
+        """
+        was_available = self._available[position] > 0
+        self._available[position] = available
+        if was_available != (available > 0):
+            self._bitmap[position >> 3] ^= 1 << (position & 7)
+            self._available_count += 1 if available > 0 else -1
+
+    def _lend(self, position: int, reader: str, now: datetime) -> Loan:
+        """
+        Создаёт выдачу экземпляра книги, который уже снят со счётчика свободных.
+        """
+        loan = Loan(next(self._ids), self._book_ids[position], reader, now + self.loan_period)
+        self.loans[loan.loan_id] = loan
+        heapq.heappush(self._due, (loan.due, loan.loan_id))
+        if len(self._due) > 2 * len(self.loans) + 64:
+            # В куче накопились сроки уже возвращённых книг — перестраиваем её по текущим выдачам
+            self._due = [(current.due, current.loan_id) for current in self.loans.values()
+                         if current.loan_id not in self._overdue]
+            heapq.heapify(self._due)
+        return loan
+
+    def _release(self, position: int, now: datetime) -> Optional[Loan]:
+        """
+        Освобождает экземпляр книги: выдаёт его первому читателю в очереди резервов
+        или увеличивает счётчик свободных экземпляров.
+        """
+        holds = self._holds.get(position)
+        while holds:
+            hold = self._hold_readers.pop(heapq.heappop(holds), None)
+            if hold is not None:
+                self._hold_counts[position] -= 1
+                if not holds:
+                    del self._holds[position]
+                return self._lend(position, hold[1], now)
+        self._holds.pop(position, None)
+        self._set_available(position, self._available[position] + 1)
+        return None
+
+    def add_copies(self, book_id: int, copies: int, now: Optional[datetime] = None) -> List[Loan]:
+        """
+        Добавляет экземпляры книги. Новые экземпляры в первую очередь выдаются читателям из очереди резервов.
+        Возвращает список созданных при этом выдач.
+        Если количество экземпляров отрицательное, вызывается ошибка ValueError.
+        """
+        if copies < 0:
+            raise ValueError("Количество экземпляров не может быть отрицательным")
+        position = self._position(book_id)
+        now = now or datetime.now()
+        self._copies[position] += copies
+        loans = []
+        for _ in range(copies):
+            loan = self._release(position, now)
+            if loan is not None:
+                loans.append(loan)
+        return loans
+
+    def get_copies(self, book_id: int) -> int:
+        """
+        Возвращает общее количество экземпляров книги.
+        """
+        return self._copies[self._position(book_id)]
+
+    def get_available_copies(self, book_id: int) -> int:
+        """
+        Возвращает количество свободных экземпляров книги.
+        """
+        return self._available[self._position(book_id)]
+
+    def is_available(self, book_id: int) -> bool:
+        """
+        Проверяет, есть ли у книги свободный экземпляр.
+        """
+        position = self._position(book_id)
+        return bool(self._bitmap[position >> 3] & (1 << (position & 7)))
+
+    def count_available(self) -> int:
+        """
+        Возвращает количество книг, у которых есть свободный экземпляр.
+        """
+        return self._available_count
+
+    def iter_available(self) -> Iterator[Book]:
+        """
+        Перебирает книги, у которых есть свободный экземпляр, в порядке books.
+        """
+        bitmap = bytes(self._bitmap)
+        books = self.books
+        for word_start in range(0, len(bitmap), 8):
+            word = int.from_bytes(bitmap[word_start:word_start + 8], "little")
+            base = word_start * 8
+            while word:
+                lowest = word & -word
+                yield books[base + lowest.bit_length() - 1]
+                word ^= lowest
+
+    def checkout(self, book_id: int, reader: str, now: Optional[datetime] = None) -> Loan:
+        """
+        Выдаёт свободный экземпляр книги читателю.
+        Если свободных экземпляров нет, вызывается ошибка ValueError.
+        """
+        position = self._position(book_id)
+        available = self._available[position]
+        if not available:
+            raise ValueError("Нет свободных экземпляров книги")
+        self._set_available(position, available - 1)
+        return self._lend(position, reader, now or datetime.now())
+
+    def return_book(self, loan_id: int, now: Optional[datetime] = None) -> Optional[Loan]:
+        """
+        Принимает экземпляр книги по выдаче.
+        Если на книгу есть резерв, экземпляр сразу выдаётся следующему читателю и возвращается новая выдача.
+        Если выдачи с запрашиваемым id не существует, вызывается ошибка ValueError.
+        """
+        loan = self.loans.pop(loan_id, None)
+        if loan is None:
+            raise ValueError("Выдачи с запрашиваемым id не существует")
+        self._overdue.discard(loan_id)
+        return self._release(self._positions[loan.book_id], now or datetime.now())
+
+    def place_hold(self, book_id: int, reader: str) -> int:
+        """
+        Ставит читателя в очередь на книгу и возвращает идентификатор резерва.
+        Если у книги есть свободный экземпляр, вызывается ошибка ValueError: книгу можно сразу взять.
+        """
+        position = self._position(book_id)
+        if self._available[position]:
+            raise ValueError("У книги есть свободный экземпляр")
+        hold_id = next(self._ids)
+        self._hold_readers[hold_id] = (position, reader)
+        heapq.heappush(self._holds.setdefault(position, []), hold_id)
+        self._hold_counts[position] = self._hold_counts.get(position, 0) + 1
+        return hold_id
+
+    def cancel_hold(self, hold_id: int) -> None:
+        """
+        Отменяет резерв. Запись удаляется из очереди при следующем освобождении экземпляра.
+        Если резерва с запрашиваемым id не существует, вызывается ошибка ValueError.
+        """
+        hold = self._hold_readers.pop(hold_id, None)
+        if hold is None:
+            raise ValueError("Резерва с запрашиваемым id не существует")
+        self._hold_counts[hold[0]] -= 1
+
+    def get_hold_count(self, book_id: int) -> int:
+        """
+        Возвращает количество резервов на книгу.
+        """
+        return self._hold_counts.get(self._position(book_id), 0)
+
+    def get_overdue(self, now: Optional[datetime] = None) -> List[Loan]:
+        """
+        Возвращает выдачи, срок возврата которых истёк, в порядке их идентификаторов.
+        Из кучи сроков извлекаются только выдачи, ставшие просроченными с прошлого вызова.
+        """
+        now = now or datetime.now()
+        while self._due and self._due[0][0] < now:
+            _, loan_id = heapq.heappop(self._due)
+            if loan_id in self.loans:
+                self._overdue.add(loan_id)
+        return [self.loans[loan_id] for loan_id in sorted(self._overdue)]
+
+
+if __name__ == '__main__':
+    list_books = [
+        Book(id_=book_dict["id"], name=book_dict["name"], pages=book_dict["pages"]) for book_dict in BOOKS_DATABASE
+    ]
+    lending = Lending(Library(books=list_books))  # по одному экземпляру каждой книги
+    print(lending.count_available())  # проверяем количество доступных книг
+
+    loan = lending.checkout(1, "reader_1", now=datetime(2023, 12, 1))  # выдаём книгу с id = 1
+    print([str(book) for book in lending.iter_available()])  # проверяем, что книга с id = 1 недоступна
+
+    lending.place_hold(1, "reader_2")  # ставим второго читателя в очередь
+    print(lending.return_book(loan.loan_id, now=datetime(2023, 12, 5)))  # книга переходит второму читателю
+
+    print(lending.get_overdue(now=datetime(2024, 1, 1)))  # проверяем просроченные выдачи
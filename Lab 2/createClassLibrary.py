@@ -1,4 +1,12 @@
-from typing import Optional
+import gc
+import json
+import mmap
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from itertools import accumulate, islice
+from typing import Iterator, Optional
 from pydantic import BaseModel
 from typing import List
 
@@ -54,6 +62,51 @@ class Book(BaseModel):
         return f"Book(id_={self.id}, name='{self.name}', pages={self.pages})"
 
 
+# Заголовок колоночного файла: сигнатура, версия формата, количество книг
+COLUMNS_HEADER = struct.Struct("<4sIQ")
+COLUMNS_MAGIC = b"LIBC"
+COLUMNS_VERSION = 2
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Временно отключает сборщик мусора.
+
+    При массовом создании объектов циклический сборщик запускается многократно
+    и обходит все уже созданные книги, что замедляет импорт в несколько раз.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _column(view: memoryview, typecode: str) -> memoryview:
+    """
+    Возвращает столбец little-endian чисел из буфера.
+    На little-endian машинах данные не копируются.
+    """
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode)
+    values.frombytes(view)
+    values.byteswap()
+    return memoryview(values)
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """
+    Проверяет размер части при чтении и записи файлов.
+    Если размер не положителен, вызывается ошибка ValueError.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер части должен быть положительным")
+
+
 class Library:
     """
     Класс, представляющий библиотеку книг.
@@ -64,6 +117,9 @@ class Library:
     Methods:
     - get_next_book_id: Возвращает идентификатор для добавления новой книги в библиотеку.
     - get_index_by_book_id: Возвращает индекс книги в списке.
+    - save_columns / load_columns: Сохраняет / загружает библиотеку в бинарном колоночном формате.
+    - save_jsonl / load_jsonl: Сохраняет / загружает библиотеку в формате JSON Lines.
+    - iter_columns / iter_jsonl: Потоково читает книги из файла частями.
 
     Usage:
     *** empty_library = Library()
@@ -73,6 +129,9 @@ class Library:
     *** library_with_books = Library(books=list_books)
     *** print(library_with_books.get_next_book_id())
     *** print(library_with_books.get_index_by_book_id(1))
+    *** library_with_books.save_columns("library.bin")
+    *** print(Library.load_columns("library.bin").books == library_with_books.books)
+    True
     """
 
     def __init__(self, books: List[Book] = None):
@@ -96,6 +155,153 @@ class Library:
                 return i
         raise ValueError("Книги с запрашиваемым id не существует")
 
+    def save_columns(self, path: str) -> None:
+        """
+        Сохраняет библиотеку в компактный бинарный колоночный файл.
+
+        Формат: заголовок COLUMNS_HEADER, затем столбцы id (int64), pages (int64, 0 вместо None),
+        смещения названий (uint64, количество книг + 1), битовая карта заполненности pages
+        (бит i установлен, если у книги i указано количество страниц) и названия в UTF-8 одним блоком.
+        Все числа записываются в порядке little-endian.
+        """
+        ids = array("q", (book.id_ for book in self.books))
+        pages = array("q", (0 if book.pages is None else book.pages for book in self.books))
+        has_pages = bytearray((len(self.books) + 7) // 8)
+        for i, book in enumerate(self.books):
+            if book.pages is not None:
+                has_pages[i >> 3] |= 1 << (i & 7)
+        names = [book.name.encode("utf-8") for book in self.books]
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(len(name) for name in names))
+        if sys.byteorder != "little":
+            for column in (ids, pages, offsets):
+                column.byteswap()
+        with open(path, "wb") as file:
+            file.write(COLUMNS_HEADER.pack(COLUMNS_MAGIC, COLUMNS_VERSION, len(self.books)))
+            file.write(ids)
+            file.write(pages)
+            file.write(offsets)
+            file.write(has_pages)
+            file.write(b"".join(names))
+
+    @staticmethod
+    def iter_columns(path: str, chunk_size: int = 100_000) -> Iterator[List[Book]]:
+        """
+        Читает колоночный файл частями по chunk_size книг.
+
+        Файл отображается в память (mmap), столбцы читаются без копирования.
+        Если файл имеет неверный формат или chunk_size не положителен, вызывается ошибка ValueError.
+        """
+        _check_chunk_size(chunk_size)
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < COLUMNS_HEADER.size:
+                raise ValueError("Файл не является колоночным файлом библиотеки")
+            magic, version, count = COLUMNS_HEADER.unpack_from(mm)
+            if magic != COLUMNS_MAGIC or version != COLUMNS_VERSION:
+                raise ValueError("Файл не является колоночным файлом библиотеки")
+            names_start = COLUMNS_HEADER.size + 8 * (3 * count + 1) + (count + 7) // 8
+            if len(mm) < names_start:
+                raise ValueError("Колоночный файл библиотеки обрезан")
+            (names_size,) = struct.unpack_from("<Q", mm, names_start - (count + 7) // 8 - 8)
+            if names_start + names_size != len(mm):
+                raise ValueError("Размер блока названий не совпадает с размером колоночного файла")
+            view = memoryview(mm)
+            columns = []
+            try:
+                start = COLUMNS_HEADER.size
+                for typecode, length in (("q", count), ("q", count), ("Q", count + 1)):
+                    end = start + 8 * length
+                    columns.append(_column(view[start:end], typecode))
+                    start = end
+                columns.append(view[start:names_start])
+                columns.append(view[names_start:])
+                ids, pages, offsets, has_pages, names = columns
+                for chunk_start in range(0, count, chunk_size):
+                    chunk_end = min(chunk_start + chunk_size, count)
+                    bounds = offsets[chunk_start:chunk_end + 1].tolist()
+                    base = bounds[0]
+                    text = str(names[base:bounds[-1]], "utf-8")
+                    if len(text) != bounds[-1] - base:
+                        # Есть не-ASCII символы: байтовые смещения не совпадают с индексами строки
+                        text = [str(names[bounds[i]:bounds[i + 1]], "utf-8") for i in range(len(bounds) - 1)]
+                    else:
+                        text = [text[start - base:end - base] for start, end in zip(bounds, bounds[1:])]
+                    present = [has_pages[i >> 3] >> (i & 7) & 1 for i in range(chunk_start, chunk_end)]
+                    with _gc_paused():
+                        chunk = [
+                            Book(id_=id_, name=name, pages=page if is_present else None)
+                            for id_, name, page, is_present in zip(
+                                ids[chunk_start:chunk_end].tolist(),
+                                text,
+                                pages[chunk_start:chunk_end].tolist(),
+                                present,
+                            )
+                        ]
+                    yield chunk
+            finally:
+                for column in columns:
+                    column.release()
+                view.release()
+
+    @classmethod
+    def load_columns(cls, path: str, chunk_size: int = 100_000) -> "Library":
+        """
+        Создаёт библиотеку из колоночного файла, записанного методом save_columns.
+        """
+        books = []
+        for chunk in cls.iter_columns(path, chunk_size):
+            books.extend(chunk)
+        return cls(books=books)
+
+    def save_jsonl(self, path: str, chunk_size: int = 100_000) -> None:
+        """
+        Сохраняет библиотеку в формате JSON Lines: одна книга на строку,
+        ключи совпадают с записями BOOKS_DATABASE ("id", "name", "pages").
+        Если chunk_size не положителен, вызывается ошибка ValueError.
+        """
+        _check_chunk_size(chunk_size)
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        with open(path, "w", encoding="utf-8") as file:
+            for chunk_start in range(0, len(self.books), chunk_size):
+                file.writelines(
+                    dumps({"id": book.id_, "name": book.name, "pages": book.pages}) + "\n"
+                    for book in self.books[chunk_start:chunk_start + chunk_size]
+                )
+
+    @staticmethod
+    def iter_jsonl(path: str, chunk_size: int = 100_000) -> Iterator[List[Book]]:
+        """
+        Потоково читает файл JSON Lines частями не более чем по chunk_size книг.
+        Пустые строки и строки из одних пробельных символов пропускаются.
+        Если chunk_size не положителен, вызывается ошибка ValueError.
+        """
+        _check_chunk_size(chunk_size)
+        loads = json.loads
+        with open(path, encoding="utf-8") as file:
+            while True:
+                lines = list(islice(file, chunk_size))
+                if not lines:
+                    return
+                with _gc_paused():
+                    chunk = []
+                    for line in lines:
+                        if line.isspace():
+                            continue
+                        record = loads(line)
+                        chunk.append(Book(id_=record["id"], name=record["name"], pages=record.get("pages")))
+                if chunk:
+                    yield chunk
+
+    @classmethod
+    def load_jsonl(cls, path: str, chunk_size: int = 100_000) -> "Library":
+        """
+        Создаёт библиотеку из файла JSON Lines, записанного методом save_jsonl.
+        """
+        books = []
+        for chunk in cls.iter_jsonl(path, chunk_size):
+            books.extend(chunk)
+        return cls(books=books)
+
 
 if __name__ == '__main__':
     empty_library = Library()  # инициализируем пустую библиотеку
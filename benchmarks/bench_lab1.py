@@ -0,0 +1,322 @@
+"""
+Бенчмарки публичных методов классов User, Contacts, Group и Leaderboard из Lab 1.
+"""
+import random
+from datetime import datetime
+
+import workloads
+from harness import benchmark
+from workloads import social
+
+
+def _group_with_members(scale: dict, seed: int = 0):
+    """
+    Создаёт группу, в которую добавлена самая крупная из скошенных групп участников.
+    """
+    users = workloads.make_users(scale["users"], seed)
+    members = workloads.skewed_memberships(users[1:], scale["groups"], seed=seed)[0]
+    group = social.Group("Bench", users[0])
+    for user in members:
+        group.add_member(user)
+    return group, members
+
+
+def _group_after_storm(scale: dict):
+    """
+    Создаёт группу с участниками и отправляет в неё поток сообщений.
+    """
+    group, members = _group_with_members(scale)
+    for sender, text in workloads.message_storm(members, scale["messages"]):
+        group.send_message(sender, text)
+    return group, members
+
+
+@benchmark("User.__init__")
+def bench_user_init(scale: dict):
+    n = scale["users"]
+    birthdate = datetime(1990, 1, 1)
+
+    def run():
+        for i in range(n):
+            social.User(f"user{i}", birthdate, "City", "+123456789")
+    return run, n
+
+
+@benchmark("User.set_description")
+def bench_user_set_description(scale: dict):
+    user = workloads.make_users(1)[0]
+    n = scale["calls"]
+
+    def run():
+        for i in range(n):
+            user.set_description(new_location=f"City {i}", new_phone_number="+987654321")
+    return run, n
+
+
+@benchmark("User.add_contact")
+def bench_user_add_contact(scale: dict):
+    owner, *others = workloads.make_users(scale["users"])
+
+    def run():
+        for other in others:
+            owner.add_contact(other)
+    return run, len(others)
+
+
+@benchmark("User.change_username")
+def bench_user_change_username(scale: dict):
+    user = workloads.make_users(1)[0]
+    n = scale["calls"]
+
+    def run():
+        for i in range(n):
+            user.change_username(f"name{i}")
+    return run, n
+
+
+@benchmark("User.get_age")
+def bench_user_get_age(scale: dict):
+    users = workloads.make_users(scale["users"])
+
+    def run():
+        for user in users:
+            user.get_age()
+    return run, len(users)
+
+
+@benchmark("User.get_location")
+def bench_user_get_location(scale: dict):
+    users = workloads.make_users(scale["users"])
+
+    def run():
+        for user in users:
+            user.get_location()
+    return run, len(users)
+
+
+@benchmark("Contacts.add_contact")
+def bench_contacts_add_contact(scale: dict):
+    users = workloads.make_users(scale["users"])
+    contacts = social.Contacts()
+
+    def run():
+        for user in users:
+            contacts.add_contact(user)
+    return run, len(users)
+
+
+@benchmark("Contacts.call")
+def bench_contacts_call(scale: dict):
+    users = workloads.make_users(scale["users"])
+    workloads.power_law_contacts(users)
+    rng = random.Random(0)
+    pairs = []
+    for _ in range(scale["calls"]):
+        caller = rng.choice(users)
+        if caller.contacts.contacts and rng.random() < 0.5:
+            receiver = rng.choice(list(caller.contacts.contacts))
+            receiver.contacts.contacts.add(caller)
+        else:
+            receiver = rng.choice(users)
+        pairs.append((caller, receiver))
+
+    def run():
+        for caller, receiver in pairs:
+            social.Contacts.call(caller, receiver)
+    return run, len(pairs)
+
+
+@benchmark("Group.__init__")
+def bench_group_init(scale: dict):
+    users = workloads.make_users(scale["users"])
+
+    def run():
+        for user in users:
+            social.Group("Bench", user)
+    return run, len(users)
+
+
+@benchmark("Group.add_member")
+def bench_group_add_member(scale: dict):
+    users = workloads.make_users(scale["users"])
+    buckets = workloads.skewed_memberships(users[scale["groups"]:], scale["groups"])
+    groups = [social.Group(f"Group{i}", users[i]) for i in range(scale["groups"])]
+
+    def run():
+        for group, members in zip(groups, buckets):
+            for user in members:
+                group.add_member(user)
+    return run, sum(len(members) for members in buckets)
+
+
+@benchmark("Group.promote_to_admin")
+def bench_group_promote_to_admin(scale: dict):
+    group, members = _group_with_members(scale)
+
+    def run():
+        for user in members:
+            group.promote_to_admin(group.creator, user)
+    return run, len(members)
+
+
+@benchmark("Group.demote_to_member")
+def bench_group_demote_to_member(scale: dict):
+    group, members = _group_with_members(scale)
+    for user in members:
+        group.promote_to_admin(group.creator, user)
+
+    def run():
+        for user in members:
+            group.demote_to_member(group.creator, user)
+    return run, len(members)
+
+
+@benchmark("Group.remove_member")
+def bench_group_remove_member(scale: dict):
+    group, members = _group_with_members(scale)
+
+    def run():
+        for user in members:
+            group.remove_member(group.creator, user)
+    return run, len(members)
+
+
+@benchmark("Group.send_message")
+def bench_group_send_message(scale: dict):
+    group, members = _group_with_members(scale)
+    storm = workloads.message_storm(members, scale["messages"])
+
+    def run():
+        for sender, text in storm:
+            group.send_message(sender, text)
+    return run, len(storm)
+
+
+@benchmark("Group.show_info")
+def bench_group_show_info(scale: dict):
+    group, _ = _group_after_storm(scale)
+
+    def run():
+        group.show_info()
+    return run, 1
+
+
+@benchmark("Group.get_user_info")
+def bench_group_get_user_info(scale: dict):
+    group, members = _group_with_members(scale)
+    rng = random.Random(0)
+    names = [rng.choice(members).username for _ in range(scale["lookups"])]
+
+    def run():
+        for name in names:
+            group.get_user_info(name)
+    return run, len(names)
+
+
+@benchmark("Group.get_role_count")
+def bench_group_get_role_count(scale: dict):
+    group, _ = _group_with_members(scale)
+    n = scale["calls"]
+
+    def run():
+        for _ in range(n):
+            group.get_role_count("member")
+    return run, n
+
+
+@benchmark("Group.get_message_count")
+def bench_group_get_message_count(scale: dict):
+    group, members = _group_after_storm(scale)
+
+    def run():
+        for user in members:
+            group.get_message_count(user)
+    return run, len(members)
+
+
+@benchmark("Group.get_messages_per_member")
+def bench_group_get_messages_per_member(scale: dict):
+    group, _ = _group_after_storm(scale)
+    n = scale["calls"]
+
+    def run():
+        for _ in range(n):
+            group.get_messages_per_member()
+    return run, n
+
+
+@benchmark("Group.get_top_senders")
+def bench_group_get_top_senders(scale: dict):
+    group, _ = _group_after_storm(scale)
+    n = scale["lookups"]
+
+    def run():
+        for _ in range(n):
+            group.get_top_senders(10)
+    return run, n
+
+
+@benchmark("Group.get_recent_top_senders")
+def bench_group_get_recent_top_senders(scale: dict):
+    group, _ = _group_after_storm(scale)
+    n = scale["lookups"]
+
+    def run():
+        for _ in range(n):
+            group.get_recent_top_senders(10)
+    return run, n
+
+
+@benchmark("Group.get_recent_message_rate")
+def bench_group_get_recent_message_rate(scale: dict):
+    group, _ = _group_after_storm(scale)
+    n = scale["calls"]
+
+    def run():
+        for _ in range(n):
+            group.get_recent_message_rate()
+    return run, n
+
+
+@benchmark("Leaderboard.add")
+def bench_leaderboard_add(scale: dict):
+    rng = random.Random(0)
+    keys = rng.choices(range(scale["users"]), weights=workloads.zipf_weights(scale["users"], 1.1), k=scale["messages"])
+    board = social.Leaderboard()
+
+    def run():
+        for key in keys:
+            board.add(key)
+    return run, len(keys)
+
+
+@benchmark("Leaderboard.top")
+def bench_leaderboard_top(scale: dict):
+    board = social.Leaderboard()
+    for key in range(scale["users"]):
+        board.add(key, key % 97)
+    n = scale["lookups"]
+
+    def run():
+        for _ in range(n):
+            board.top(10)
+    return run, n
+
+
+@benchmark("Group.can")
+def bench_group_can(scale: dict):
+    """
+    Проверки прав модератором: случайные действия случайных участников над случайными участниками.
+    """
+    group, members = _group_with_members(scale)
+    for user in members[::10]:
+        group.promote_to_admin(group.creator, user)
+    actors = [group.creator] + members
+    actions = list(social.GROUP_PERMISSIONS)
+    rng = random.Random(0)
+    checks = [(rng.choice(actors), rng.choice(actions), rng.choice(members)) for _ in range(scale["calls"])]
+
+    def run():
+        for actor, action, target in checks:
+            group.can(actor, action, target)
+    return run, len(checks)
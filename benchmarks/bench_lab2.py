@@ -0,0 +1,333 @@
+"""
+Бенчмарки публичных методов классов Book, Library и Lending из Lab 2.
+"""
+import atexit
+import os
+import random
+import shutil
+import tempfile
+from collections import deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List
+
+import paths  # noqa: F401  (добавляет каталоги лабораторных в sys.path)
+import createClassBook
+import createClassLibrary
+import createClassLending
+import workloads
+from harness import benchmark
+
+
+SCRATCH = tempfile.mkdtemp(prefix="library-bench-")
+atexit.register(shutil.rmtree, SCRATCH, ignore_errors=True)
+
+
+@lru_cache(maxsize=2)
+def _catalog(n: int) -> List[createClassLibrary.Book]:
+    """
+    Возвращает каталог из n книг. Методы Library не изменяют список книг,
+    поэтому один каталог переиспользуется между повторами.
+    """
+    return [
+        createClassLibrary.Book(id_=record["id"], name=record["name"], pages=record["pages"])
+        for record in workloads.book_records(n)
+    ]
+
+
+@benchmark("Book.__init__")
+def bench_book_init(scale: dict):
+    records = list(workloads.book_records(scale["books"]))
+
+    def run():
+        for record in records:
+            createClassBook.Book(id=record["id"], name=record["name"], pages=record["pages"])
+    return run, len(records)
+
+
+@benchmark("Book.__str__")
+def bench_book_str(scale: dict):
+    books = [createClassBook.Book(**record) for record in workloads.book_records(scale["calls"])]
+
+    def run():
+        for book in books:
+            str(book)
+    return run, len(books)
+
+
+@benchmark("Book.__repr__")
+def bench_book_repr(scale: dict):
+    books = [createClassBook.Book(**record) for record in workloads.book_records(scale["calls"])]
+
+    def run():
+        for book in books:
+            repr(book)
+    return run, len(books)
+
+
+@benchmark("Library.__init__")
+def bench_library_init(scale: dict):
+    books = _catalog(scale["books"])
+    n = scale["calls"]
+
+    def run():
+        for _ in range(n):
+            createClassLibrary.Library(books=books)
+    return run, n
+
+
+@benchmark("Library.get_next_book_id")
+def bench_library_get_next_book_id(scale: dict):
+    library = createClassLibrary.Library(books=_catalog(scale["books"]))
+    n = scale["book_lookups"]
+
+    def run():
+        for _ in range(n):
+            library.get_next_book_id()
+    return run, n
+
+
+@benchmark("Library.get_index_by_book_id")
+def bench_library_get_index_by_book_id(scale: dict):
+    library = createClassLibrary.Library(books=_catalog(scale["books"]))
+    rng = random.Random(0)
+    ids = [rng.randrange(1, scale["books"] + 1) for _ in range(scale["book_lookups"])]
+
+    def run():
+        for book_id in ids:
+            library.get_index_by_book_id(book_id)
+    return run, len(ids)
+
+
+def _bench_save(method: str, scale: dict):
+    library = createClassLibrary.Library(books=_catalog(scale["books"]))
+    path = os.path.join(SCRATCH, method)
+
+    def run():
+        getattr(library, method)(path)
+    return run, len(library.books)
+
+
+def _bench_load(save: str, load: str, scale: dict):
+    library = createClassLibrary.Library(books=_catalog(scale["books"]))
+    path = os.path.join(SCRATCH, save)
+    if not os.path.exists(path):
+        getattr(library, save)(path)
+
+    def run():
+        getattr(createClassLibrary.Library, load)(path)
+    return run, len(library.books)
+
+
+@benchmark("Library.save_columns")
+def bench_library_save_columns(scale: dict):
+    return _bench_save("save_columns", scale)
+
+
+@benchmark("Library.load_columns")
+def bench_library_load_columns(scale: dict):
+    return _bench_load("save_columns", "load_columns", scale)
+
+
+@benchmark("Library.save_jsonl")
+def bench_library_save_jsonl(scale: dict):
+    return _bench_save("save_jsonl", scale)
+
+
+@benchmark("Library.load_jsonl")
+def bench_library_load_jsonl(scale: dict):
+    return _bench_load("save_jsonl", "load_jsonl", scale)
+
+
+# Интервал между событиями выдачи: 10^7 событий покрывают около 10 лет работы библиотеки
+EVENT_STEP = timedelta(seconds=30)
+OVERDUE_SWEEP_EVERY = 10_000
+
+
+@lru_cache(maxsize=1)
+def _loan_events(n_books: int, n: int):
+    return workloads.loan_events(n_books, n)
+
+
+def _lending(scale: dict, copies: int = 1) -> createClassLending.Lending:
+    return createClassLending.Lending(createClassLibrary.Library(books=_catalog(scale["loan_books"])), copies=copies)
+
+
+@benchmark("Lending.__init__")
+def bench_lending_init(scale: dict):
+    library = createClassLibrary.Library(books=_catalog(scale["loan_books"]))
+
+    def run():
+        createClassLending.Lending(library, copies=2)
+    return run, len(library.books)
+
+
+@benchmark("Lending.events")
+def bench_lending_events(scale: dict):
+    """
+    Смешанный поток выдач, возвратов, резервов и отмен с периодическим поиском просроченных выдач.
+    """
+    lending = _lending(scale, copies=2)
+    ops, book_ids = _loan_events(scale["loan_books"], scale["loan_events"])
+
+    def run():
+        loans = deque()
+        holds = deque()
+        now = datetime(2023, 1, 1)
+        for i, (op, book_id) in enumerate(zip(ops, book_ids)):
+            now += EVENT_STEP
+            if op == 0:
+                if lending.is_available(book_id):
+                    loans.append(lending.checkout(book_id, "reader", now).loan_id)
+                else:
+                    holds.append(lending.place_hold(book_id, "reader"))
+            elif op == 1 and loans:
+                loan = lending.return_book(loans.popleft(), now)
+                if loan is not None:
+                    loans.append(loan.loan_id)
+            elif op == 2 and holds:
+                try:
+                    lending.cancel_hold(holds.popleft())
+                except ValueError:
+                    pass  # резерв уже превратился в выдачу
+            if i % OVERDUE_SWEEP_EVERY == 0:
+                lending.get_overdue(now)
+    return run, len(ops)
+
+
+@benchmark("Lending.checkout")
+def bench_lending_checkout(scale: dict):
+    lending = _lending(scale)
+    now = datetime(2023, 1, 1)
+    book_ids = [book.id_ for book in lending.books]
+
+    def run():
+        for book_id in book_ids:
+            lending.checkout(book_id, "reader", now)
+    return run, len(book_ids)
+
+
+@benchmark("Lending.return_book")
+def bench_lending_return_book(scale: dict):
+    lending = _lending(scale)
+    now = datetime(2023, 1, 1)
+    loan_ids = [lending.checkout(book.id_, "reader", now).loan_id for book in lending.books]
+
+    def run():
+        for loan_id in loan_ids:
+            lending.return_book(loan_id, now)
+    return run, len(loan_ids)
+
+
+@benchmark("Lending.place_hold")
+def bench_lending_place_hold(scale: dict):
+    lending = _lending(scale, copies=0)
+    book_ids = [book.id_ for book in lending.books]
+
+    def run():
+        for book_id in book_ids:
+            lending.place_hold(book_id, "reader")
+    return run, len(book_ids)
+
+
+@benchmark("Lending.cancel_hold")
+def bench_lending_cancel_hold(scale: dict):
+    lending = _lending(scale, copies=0)
+    hold_ids = [lending.place_hold(book.id_, "reader") for book in lending.books]
+
+    def run():
+        for hold_id in hold_ids:
+            lending.cancel_hold(hold_id)
+    return run, len(hold_ids)
+
+
+@benchmark("Lending.add_copies")
+def bench_lending_add_copies(scale: dict):
+    lending = _lending(scale, copies=0)
+    now = datetime(2023, 1, 1)
+    book_ids = [book.id_ for book in lending.books]
+    for book_id in book_ids[::2]:
+        lending.place_hold(book_id, "reader")
+
+    def run():
+        for book_id in book_ids:
+            lending.add_copies(book_id, 1, now)
+    return run, len(book_ids)
+
+
+def _bench_book_query(method: str, scale: dict):
+    lending = _lending(scale)
+    rng = random.Random(0)
+    book_ids = [rng.randrange(1, scale["loan_books"] + 1) for _ in range(scale["calls"])]
+    query = getattr(lending, method)
+
+    def run():
+        for book_id in book_ids:
+            query(book_id)
+    return run, len(book_ids)
+
+
+@benchmark("Lending.is_available")
+def bench_lending_is_available(scale: dict):
+    return _bench_book_query("is_available", scale)
+
+
+@benchmark("Lending.get_copies")
+def bench_lending_get_copies(scale: dict):
+    return _bench_book_query("get_copies", scale)
+
+
+@benchmark("Lending.get_available_copies")
+def bench_lending_get_available_copies(scale: dict):
+    return _bench_book_query("get_available_copies", scale)
+
+
+@benchmark("Lending.get_hold_count")
+def bench_lending_get_hold_count(scale: dict):
+    return _bench_book_query("get_hold_count", scale)
+
+
+@benchmark("Lending.count_available")
+def bench_lending_count_available(scale: dict):
+    lending = _lending(scale)
+    n = scale["calls"]
+
+    def run():
+        for _ in range(n):
+            lending.count_available()
+    return run, n
+
+
+@benchmark("Lending.iter_available")
+def bench_lending_iter_available(scale: dict):
+    """
+    Перебор доступных книг, когда занято 99% каталога.
+    """
+    lending = _lending(scale)
+    now = datetime(2023, 1, 1)
+    for book in lending.books:
+        if book.id_ % 100:
+            lending.checkout(book.id_, "reader", now)
+
+    def run():
+        for _ in lending.iter_available():
+            pass
+    return run, len(lending.books)
+
+
+@benchmark("Lending.get_overdue")
+def bench_lending_get_overdue(scale: dict):
+    """
+    Поиск просроченных выдач, когда просрочена 1% выдач, а остальные ещё в сроке.
+    """
+    lending = _lending(scale)
+    start = datetime(2023, 1, 1)
+    for book in lending.books:
+        lending.checkout(book.id_, "reader", start if book.id_ % 100 == 0 else start + timedelta(days=30))
+    n = scale["lookups"]
+    now = start + lending.loan_period + timedelta(days=1)
+
+    def run():
+        for _ in range(n):
+            lending.get_overdue(now)
+    return run, n
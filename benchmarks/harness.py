@@ -0,0 +1,155 @@
+"""
+Инструменты для измерения времени и сравнения результатов с базовой линией.
+
+Бенчмарк — это функция setup(scale), которая готовит данные (не измеряется) и
+возвращает пару (run, ops): функцию без аргументов, выполняющую ops операций,
+и количество этих операций. Перед каждым повтором setup вызывается заново,
+поэтому методы, изменяющие состояние, всегда измеряются на одинаковых данных.
+"""
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+Setup = Callable[[dict], Tuple[Callable[[], None], int]]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """
+    Регистрирует функцию подготовки бенчмарка под указанным именем.
+
+    Args:
+        name (str): Имя бенчмарка, например "Group.send_message".
+
+    Returns:
+        Callable: Декоратор, возвращающий функцию без изменений.
+    """
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Бенчмарк {name} уже зарегистрирован")
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def measure(name: str, setup: Setup, scale: dict, repeat: int) -> dict:
+    """
+    Запускает бенчмарк repeat раз и возвращает статистику.
+
+    Вывод методов (print) перенаправляется в os.devnull, но его стоимость
+    остаётся частью измерения, так как это поведение самих методов.
+
+    Args:
+        name (str): Имя бенчмарка.
+        setup (Setup): Функция подготовки.
+        scale (dict): Параметры размера нагрузки.
+        repeat (int): Количество повторов.
+
+    Returns:
+        dict: Результат с ключами name, ops, best, mean, ns_per_op, ops_per_sec.
+            Если подготовка вернула 0 операций, ns_per_op и ops_per_sec равны None.
+
+    Raises:
+        ValueError: Если repeat меньше 1.
+    """
+    if repeat < 1:
+        raise ValueError("Количество повторов должно быть не меньше 1")
+    timings: List[float] = []
+    ops = 0
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        for _ in range(repeat):
+            run, ops = setup(scale)
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "name": name,
+        "ops": ops,
+        "best": best,
+        "mean": sum(timings) / len(timings),
+        "ns_per_op": best / ops * 1e9 if ops else None,
+        "ops_per_sec": (ops / best if best else float("inf")) if ops else None,
+    }
+
+
+def environment() -> dict:
+    """
+    Возвращает описание окружения, в котором выполнялись измерения.
+    """
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save(path: str, scale_name: str, results: List[dict]) -> None:
+    """
+    Сохраняет результаты в JSON-файл.
+
+    Args:
+        path (str): Путь к файлу.
+        scale_name (str): Название использованного масштаба нагрузки.
+        results (List[dict]): Результаты measure().
+    """
+    data = {"scale": scale_name, "environment": environment(), "results": results}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str, scale_name: str) -> dict:
+    """
+    Загружает базовую линию и проверяет, что она записана для того же масштаба нагрузки.
+
+    Args:
+        path (str): Путь к файлу базовой линии.
+        scale_name (str): Название масштаба текущего запуска.
+
+    Returns:
+        dict: Содержимое файла базовой линии.
+
+    Raises:
+        ValueError: Если файл повреждён или базовая линия записана для другого масштаба нагрузки.
+    """
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if not isinstance(baseline, dict) or "results" not in baseline:
+        raise ValueError(f"Файл {path} не является базовой линией")
+    if baseline.get("scale") != scale_name:
+        raise ValueError(f"Базовая линия {path} записана для масштаба {baseline.get('scale')}, а не {scale_name}")
+    return baseline
+
+
+def compare(baseline: dict, results: List[dict], tolerance: float) -> List[str]:
+    """
+    Сравнивает результаты с базовой линией, загруженной load_baseline.
+
+    Регрессией считается рост времени на операцию больше, чем в (1 + tolerance) раз.
+    Бенчмарки, которых нет в базовой линии или для которых нет времени на операцию, пропускаются.
+
+    Args:
+        baseline (dict): Базовая линия.
+        results (List[dict]): Результаты текущего запуска.
+        tolerance (float): Допустимое относительное замедление.
+
+    Returns:
+        List[str]: Описания найденных регрессий (пустой список, если их нет).
+    """
+    reference = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = reference.get(result["name"])
+        if old is None or not old.get("ns_per_op") or result["ns_per_op"] is None:
+            continue
+        ratio = result["ns_per_op"] / old["ns_per_op"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{result['name']}: {old['ns_per_op']:.1f} -> {result['ns_per_op']:.1f} нс/оп (x{ratio:.2f})")
+    return regressions
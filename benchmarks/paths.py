@@ -0,0 +1,15 @@
+"""
+Добавляет каталоги лабораторных работ в sys.path.
+
+Каталоги "Lab 1" и "Lab 2" содержат пробелы в названиях и не являются пакетами,
+поэтому модули из них импортируются напрямую: main, createClassBook, createClassLibrary.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAB_DIRS = [os.path.join(ROOT, "Lab 1"), os.path.join(ROOT, "Lab 2")]
+
+for lab_dir in LAB_DIRS:
+    if lab_dir not in sys.path:
+        sys.path.insert(0, lab_dir)
@@ -0,0 +1,124 @@
+"""
+Запуск набора бенчмарков.
+
+Примеры:
+    python benchmarks/run.py                                # быстрый прогон, результаты в results.json
+    python benchmarks/run.py --scale full --repeat 3        # полный масштаб (миллионы книг)
+    python benchmarks/run.py --save-baseline                # записать базовую линию
+    python benchmarks/run.py --baseline baseline.json       # сравнить с базовой линией
+    python benchmarks/run.py --suite lab1 -k Group          # только бенчмарки Group из Lab 1
+"""
+import argparse
+import importlib
+import os
+import sys
+
+import harness
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+SCALES = {
+    "quick": {
+        "users": 2_000,
+        "groups": 20,
+        "calls": 10_000,
+        "messages": 20_000,
+        "lookups": 200,
+        "books": 10_000,
+        "book_lookups": 100,
+        "loan_books": 10_000,
+        "loan_events": 100_000,
+    },
+    "full": {
+        "users": 100_000,
+        "groups": 200,
+        "calls": 200_000,
+        "messages": 1_000_000,
+        "lookups": 1_000,
+        "books": 2_000_000,
+        "book_lookups": 20,
+        "loan_books": 1_000_000,
+        "loan_events": 10_000_000,
+    },
+}
+
+SUITES = {
+    "lab1": "bench_lab1",
+    "lab2": "bench_lab2",
+}
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"ожидается целое число не меньше 1: {value}")
+    return number
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Бенчмарки классов из Lab 1 и Lab 2.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="quick", help="масштаб нагрузки")
+    parser.add_argument("--repeat", type=positive_int, default=5, help="количество повторов каждого бенчмарка")
+    parser.add_argument("--suite", nargs="+", choices=sorted(SUITES), default=sorted(SUITES),
+                        help="наборы бенчмарков для запуска")
+    parser.add_argument("-k", dest="keyword", default="", help="запускать только бенчмарки, имя которых содержит строку")
+    parser.add_argument("--output", default=os.path.join(HERE, "results.json"), help="файл для результатов")
+    parser.add_argument("--baseline", help=f"файл базовой линии (по умолчанию {DEFAULT_BASELINE}; "
+                                           "явно указанный файл обязан существовать)")
+    parser.add_argument("--save-baseline", action="store_true", help="записать результаты как базовую линию")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="допустимое относительное замедление по сравнению с базовой линией")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    for suite in args.suite:
+        importlib.import_module(SUITES[suite])
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    baseline = None
+    if not args.save_baseline and args.baseline is not None and not os.path.exists(args.baseline):
+        print(f"Ошибка: базовая линия {args.baseline} не найдена", file=sys.stderr)
+        return 2
+    if not args.save_baseline and os.path.exists(baseline_path):
+        # Проверяем базовую линию до измерений, чтобы не ждать окончания полного прогона
+        try:
+            baseline = harness.load_baseline(baseline_path, args.scale)
+        except ValueError as error:
+            print(f"Ошибка: {error}", file=sys.stderr)
+            return 2
+
+    scale = SCALES[args.scale]
+    results = []
+    for name, setup in harness.BENCHMARKS.items():
+        if args.keyword not in name:
+            continue
+        result = harness.measure(name, setup, scale, args.repeat)
+        results.append(result)
+        if result["ops"]:
+            print(f"{name:<40} {result['ops']:>10} оп  {result['ns_per_op']:>14.1f} нс/оп  "
+                  f"{result['ops_per_sec']:>14.0f} оп/с")
+        else:
+            print(f"{name:<40} {0:>10} оп  (нет операций при этом масштабе)")
+
+    harness.save(args.output, args.scale, results)
+    print(f"Результаты записаны в {args.output}")
+
+    if args.save_baseline:
+        harness.save(baseline_path, args.scale, results)
+        print(f"Базовая линия записана в {baseline_path}")
+        return 0
+    if baseline is None:
+        print("Базовая линия не найдена, сравнение пропущено")
+        return 0
+
+    regressions = harness.compare(baseline, results, args.tolerance)
+    for regression in regressions:
+        print(f"РЕГРЕССИЯ {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
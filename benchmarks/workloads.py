@@ -0,0 +1,164 @@
+"""
+Генераторы синтетических нагрузок для бенчмарков.
+
+Все генераторы детерминированы: одинаковый seed даёт одинаковые данные, поэтому
+результаты разных запусков можно сравнивать между собой.
+"""
+import random
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Iterator, List, Tuple
+
+import paths  # noqa: F401  (добавляет каталоги лабораторных в sys.path)
+import main as social
+
+
+def zipf_weights(n: int, alpha: float) -> List[float]:
+    """
+    Возвращает веса распределения Ципфа для n элементов.
+
+    Args:
+        n (int): Количество элементов.
+        alpha (float): Показатель степени (чем больше, тем сильнее перекос).
+
+    Returns:
+        List[float]: Веса 1 / k ** alpha для k = 1..n.
+
+    Example:
+        >>> zipf_weights(3, 1.0)
+        [1.0, 0.5, 0.3333333333333333]
+    """
+    return [1.0 / k ** alpha for k in range(1, n + 1)]
+
+
+def make_users(n: int, seed: int = 0) -> List["social.User"]:
+    """
+    Создаёт n пользователей со случайными датами рождения и городами.
+
+    Args:
+        n (int): Количество пользователей.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Returns:
+        List[User]: Список пользователей.
+    """
+    rng = random.Random(seed)
+    start = datetime(1950, 1, 1)
+    users = []
+    for i in range(n):
+        birthdate = start + timedelta(days=rng.randrange(365 * 55))
+        users.append(social.User(f"user{i}", birthdate, f"City {rng.randrange(100)}", f"+{rng.randrange(10 ** 10)}"))
+    return users
+
+
+def power_law_contacts(users: List["social.User"], alpha: float = 2.0, seed: int = 0) -> int:
+    """
+    Связывает пользователей контактами со степенным распределением числа контактов.
+
+    Число контактов каждого пользователя берётся из распределения Парето, поэтому
+    большинство пользователей имеет несколько контактов, а небольшая часть — тысячи.
+    Контакты добавляются напрямую в множество, без вывода сообщений.
+
+    Args:
+        users (List[User]): Пользователи.
+        alpha (float, optional): Параметр формы распределения Парето.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Returns:
+        int: Общее количество добавленных связей.
+    """
+    rng = random.Random(seed)
+    total = 0
+    for user in users:
+        degree = min(len(users) - 1, int(rng.paretovariate(alpha)))
+        for contact in rng.sample(users, degree):
+            if contact is not user:
+                user.contacts.contacts.add(contact)
+                total += 1
+    return total
+
+
+def skewed_memberships(users: List["social.User"], groups: int, alpha: float = 1.2,
+                       seed: int = 0) -> List[List["social.User"]]:
+    """
+    Распределяет пользователей по группам с перекосом по Ципфу.
+
+    Первая группа получает больше всего участников, последующие — всё меньше.
+
+    Args:
+        users (List[User]): Пользователи.
+        groups (int): Количество групп.
+        alpha (float, optional): Показатель распределения Ципфа.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Returns:
+        List[List[User]]: Списки участников для каждой группы.
+    """
+    rng = random.Random(seed)
+    buckets: List[List["social.User"]] = [[] for _ in range(groups)]
+    indexes = rng.choices(range(groups), weights=zipf_weights(groups, alpha), k=len(users))
+    for user, index in zip(users, indexes):
+        buckets[index].append(user)
+    return buckets
+
+
+def message_storm(senders: List["social.User"], n: int, alpha: float = 1.1,
+                  seed: int = 0) -> List[Tuple["social.User", str]]:
+    """
+    Генерирует поток сообщений, в котором немногие отправители пишут большую часть сообщений.
+
+    Args:
+        senders (List[User]): Возможные отправители.
+        n (int): Количество сообщений.
+        alpha (float, optional): Показатель распределения Ципфа по отправителям.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Returns:
+        List[Tuple[User, str]]: Пары (отправитель, текст).
+    """
+    rng = random.Random(seed)
+    chosen = rng.choices(senders, weights=zipf_weights(len(senders), alpha), k=n)
+    return [(sender, f"message {i}") for i, sender in enumerate(chosen)]
+
+
+def book_records(n: int, seed: int = 0) -> Iterator[dict]:
+    """
+    Генерирует записи о книгах в формате BOOKS_DATABASE.
+
+    Args:
+        n (int): Количество книг.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Yields:
+        dict: Запись с ключами "id", "name", "pages".
+
+    Example:
+        >>> next(book_records(1))
+        {'id': 1, 'name': 'test_name_1', 'pages': 838}
+    """
+    rng = random.Random(seed)
+    for i in range(1, n + 1):
+        yield {"id": i, "name": f"test_name_{i}", "pages": rng.randrange(50, 1500)}
+
+
+def loan_events(n_books: int, n: int, alpha: float = 1.1, seed: int = 0) -> Tuple[bytearray, array]:
+    """
+    Генерирует поток событий выдачи книг: 0 — взять книгу (или встать в очередь),
+    1 — вернуть самую давнюю выдачу, 2 — отменить самый давний резерв.
+    Книги выбираются по распределению Ципфа, поэтому популярные книги быстро заканчиваются.
+
+    Args:
+        n_books (int): Количество книг (id от 1 до n_books).
+        n (int): Количество событий.
+        alpha (float, optional): Показатель распределения Ципфа по книгам.
+        seed (int, optional): Зерно генератора случайных чисел.
+
+    Returns:
+        Tuple[bytearray, array]: Коды событий и идентификаторы книг.
+    """
+    rng = random.Random(seed)
+    ops = bytearray(rng.choices(range(3), weights=[50, 42, 8], k=n))
+    cum_weights = list(accumulate(zipf_weights(n_books, alpha)))
+    book_ids = array("l", rng.choices(range(1, n_books + 1), cum_weights=cum_weights, k=n))
+    return ops, book_ids